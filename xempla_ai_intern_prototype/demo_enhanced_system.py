@@ -11,35 +11,247 @@ This script demonstrates all the enhanced features including:
 - Production optimization
 """
 
-import os
 import sys
-import json
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
+
+# Output is buffered per demo section: each line is appended here and the
+# whole section is written with one sys.stdout.write instead of one
+# locked, possibly-unbuffered write() per print call
+_BUF = []
+
+# Rules and message prefixes built once at import; the helpers below only
+# concatenate cached strings instead of re-multiplying/re-formatting
+_HRULE_EQ = "=" * 80
+_HRULE_DASH = "-" * 60
+_OK = "✅ "
+_INFO = "ℹ️  "
+_WARN = "⚠️  "
+
+def flush_output():
+    """Write and clear the buffered demo output in a single call"""
+    if _BUF:
+        _BUF.append("")
+        sys.stdout.write("\n".join(_BUF))
+        sys.stdout.flush()
+        _BUF.clear()
 
 def print_header(title):
     """Print formatted header"""
-    print("\n" + "=" * 80)
-    print(f"🎯 {title}")
-    print("=" * 80)
+    _BUF.append("\n" + _HRULE_EQ)
+    _BUF.append("🎯 " + title)
+    _BUF.append(_HRULE_EQ)
 
 def print_section(title):
     """Print formatted section"""
-    print(f"\n📋 {title}")
-    print("-" * 60)
+    _BUF.append("\n📋 " + title)
+    _BUF.append(_HRULE_DASH)
 
 def print_success(message):
     """Print success message"""
-    print(f"✅ {message}")
+    _BUF.append(_OK + message)
 
 def print_info(message):
     """Print info message"""
-    print(f"ℹ️  {message}")
+    _BUF.append(_INFO + message)
 
 def print_warning(message):
     """Print warning message"""
-    print(f"⚠️  {message}")
+    _BUF.append(_WARN + message)
+
+# Static demo content, built once at import instead of on every call
+_INDUSTRY_ANALYTICS = {
+    "🏭 Manufacturing": {
+        "features": [
+            "Production line optimization",
+            "Equipment health monitoring", 
+            "Quality control automation",
+            "Supply chain optimization",
+            "Safety protocol implementation"
+        ],
+        "metrics": ["Production efficiency", "Equipment uptime", "Quality scores", "Safety incidents"]
+    },
+    "⚡ Energy": {
+        "features": [
+            "Grid optimization",
+            "Demand response management",
+            "Renewable energy integration",
+            "Energy storage management",
+            "Grid stability monitoring"
+        ],
+        "metrics": ["Grid efficiency", "Renewable percentage", "Demand response", "Grid stability"]
+    },
+    "🏥 Healthcare": {
+        "features": [
+            "Patient comfort optimization",
+            "Medical equipment monitoring",
+            "Air quality management",
+            "Safety standards compliance",
+            "Facility management"
+        ],
+        "metrics": ["Patient comfort", "Equipment uptime", "Air quality", "Safety scores"]
+    },
+    "🛍️ Retail": {
+        "features": [
+            "Store optimization",
+            "Inventory management",
+            "Customer satisfaction",
+            "Energy-efficient systems",
+            "Sales performance"
+        ],
+        "metrics": ["Customer satisfaction", "Inventory accuracy", "Sales performance", "Energy efficiency"]
+    },
+    "🏢 Office": {
+        "features": [
+            "Workspace utilization",
+            "Smart building controls",
+            "Occupant comfort",
+            "Energy savings",
+            "Productivity tracking"
+        ],
+        "metrics": ["Occupant comfort", "Workspace utilization", "Productivity", "Energy efficiency"]
+    }
+}
+
+_ANALYTICS_CATEGORIES = {
+    "⚡ Energy Savings Analysis": {
+        "capabilities": [
+            "Current consumption tracking",
+            "Peak demand analysis", 
+            "15-20% savings potential",
+            "Optimization recommendations",
+            "Cost impact analysis"
+        ]
+    },
+    "📈 Efficiency Optimization": {
+        "capabilities": [
+            "Current efficiency measurement",
+            "Trend analysis",
+            "Improvement potential",
+            "Industry benchmarking",
+            "Best practices implementation"
+        ]
+    },
+    "💰 Cost & ROI Analysis": {
+        "capabilities": [
+            "Total cost tracking",
+            "Cost breakdown analysis",
+            "Reduction opportunities",
+            "ROI calculations",
+            "Budget planning"
+        ]
+    },
+    "🛡️ Safety & Maintenance": {
+        "capabilities": [
+            "Safety score tracking",
+            "Predictive maintenance",
+            "Risk identification",
+            "Compliance monitoring",
+            "Incident prevention"
+        ]
+    },
+    "🏭 Production Analytics": {
+        "capabilities": [
+            "Output tracking",
+            "Efficiency metrics",
+            "Quality control",
+            "Optimization opportunities",
+            "Capacity planning"
+        ]
+    }
+}
+
+_COMPONENTS = {
+    "Frontend": ["Streamlit", "Plotly", "Responsive Design", "User-Friendly Interface"],
+    "Backend": ["Python", "Pandas", "NumPy", "Google Gemini"],
+    "Data Processing": ["Real-time Analysis", "Data Validation", "Error Handling", "Performance Optimization"]
+}
+
+_FUTURE_ENHANCEMENTS = {
+    "Advanced Analytics": [
+        "Machine learning model integration",
+        "Advanced anomaly detection",
+        "Predictive modeling capabilities",
+        "Real-time streaming data",
+        "Advanced visualization options"
+    ],
+    "System Expansion": [
+        "Multi-agent coordination",
+        "Cloud deployment options",
+        "API integration capabilities",
+        "Mobile application",
+        "Advanced reporting features"
+    ],
+    "Industry Expansion": [
+        "Additional industry types",
+        "Custom industry templates",
+        "Regulatory compliance features",
+        "International market support",
+        "Specialized analytics modules"
+    ],
+    "Production Deployment": [
+        "Cloud infrastructure setup",
+        "Security and authentication",
+        "Monitoring and alerting systems",
+        "Performance optimization",
+        "Scalability enhancements"
+    ]
+}
+
+# Static file-structure tree, encoded to UTF-8 once at import; it is
+# written straight to the stdout byte buffer, skipping print and the
+# per-call encode
+_STRUCTURE_BYTES = ("""
+xempla_ai_intern_prototype/
+├── 📊 Enhanced Analytics Dashboard
+│   ├── enhanced_dashboard.py          # Main interactive dashboard
+│   ├── dashboard.py                   # Original dashboard
+│   └── dashboard.html                 # Static HTML dashboard
+├── 📤 File Upload & Analysis
+│   ├── sample_data_generator.py       # Sample data generation
+│   └── sample_data/                   # Generated test data
+├── 🤖 AI Integration
+│   ├── src/llm/llm_client.py         # Google Gemini integration
+│   ├── src/agents/                    # AI agent implementations
+│   └── src/feedback/feedback_loop.py # Feedback mechanisms
+├── 📊 Data Processing
+│   ├── src/simulation/               # Data processing modules
+│   └── data/building_energy_dataset/ # Real building data
+├── 📋 Documentation
+│   ├── DESCRIPTION.md                # Comprehensive feature guide
+│   ├── FINAL_SUMMARY.md              # Project summary
+│   └── README.md                     # Setup instructions
+└── 🎯 Demo Scripts
+    ├── building_energy_demo.py       # Main demonstration
+    ├── quick_start.py                # Quick demo
+    └── final_output.py               # System summary
+""" "\n").encode("utf-8")
+
+def _render(header, groups):
+    """Render one demo section from precomputed (section, lines) pairs"""
+    print_header(header)
+    for section, lines in groups:
+        print_section(section)
+        _BUF.extend(lines)
+
+# Line lists joined to the constants above, assembled once at import so the
+# demo functions reduce to a single _render call over ready-made strings
+_INDUSTRY_GROUPS = tuple(
+    (industry,
+     [_INFO + "Key Features:"]
+     + ["   • " + feature for feature in details["features"]]
+     + [_INFO + "Key Metrics:"]
+     + ["   • " + metric for metric in details["metrics"]])
+    for industry, details in _INDUSTRY_ANALYTICS.items()
+)
+
+_ANALYTICS_GROUPS = tuple(
+    (category, [_OK + "✓ " + capability for capability in details["capabilities"]])
+    for category, details in _ANALYTICS_CATEGORIES.items()
+)
+
+_ENHANCEMENT_GROUPS = tuple(
+    (category, [_INFO + "• " + feature for feature in features])
+    for category, features in _FUTURE_ENHANCEMENTS.items()
+)
 
 def demo_file_upload_capabilities():
     """Demonstrate file upload and analysis capabilities"""
@@ -61,7 +273,7 @@ def demo_file_upload_capabilities():
     
     print_info("Core Metrics Required:")
     for col in required_columns:
-        print(f"   • {col}")
+        _BUF.append(f"   • {col}")
     
     optional_columns = [
         "temperature",
@@ -72,7 +284,7 @@ def demo_file_upload_capabilities():
     
     print_info("Optional Metrics:")
     for col in optional_columns:
-        print(f"   • {col}")
+        _BUF.append(f"   • {col}")
     
     print_section("Sample Data Generation")
     print_info("Generated sample data for 5 industries:")
@@ -90,131 +302,15 @@ def demo_file_upload_capabilities():
     ]
     
     for i, step in enumerate(steps, 1):
-        print(f"{i}. {step}")
+        _BUF.append(f"{i}. {step}")
 
 def demo_industry_analytics():
     """Demonstrate industry-specific analytics"""
-    print_header("INDUSTRY-SPECIFIC ANALYTICS")
-    
-    industries = {
-        "🏭 Manufacturing": {
-            "features": [
-                "Production line optimization",
-                "Equipment health monitoring", 
-                "Quality control automation",
-                "Supply chain optimization",
-                "Safety protocol implementation"
-            ],
-            "metrics": ["Production efficiency", "Equipment uptime", "Quality scores", "Safety incidents"]
-        },
-        "⚡ Energy": {
-            "features": [
-                "Grid optimization",
-                "Demand response management",
-                "Renewable energy integration",
-                "Energy storage management",
-                "Grid stability monitoring"
-            ],
-            "metrics": ["Grid efficiency", "Renewable percentage", "Demand response", "Grid stability"]
-        },
-        "🏥 Healthcare": {
-            "features": [
-                "Patient comfort optimization",
-                "Medical equipment monitoring",
-                "Air quality management",
-                "Safety standards compliance",
-                "Facility management"
-            ],
-            "metrics": ["Patient comfort", "Equipment uptime", "Air quality", "Safety scores"]
-        },
-        "🛍️ Retail": {
-            "features": [
-                "Store optimization",
-                "Inventory management",
-                "Customer satisfaction",
-                "Energy-efficient systems",
-                "Sales performance"
-            ],
-            "metrics": ["Customer satisfaction", "Inventory accuracy", "Sales performance", "Energy efficiency"]
-        },
-        "🏢 Office": {
-            "features": [
-                "Workspace utilization",
-                "Smart building controls",
-                "Occupant comfort",
-                "Energy savings",
-                "Productivity tracking"
-            ],
-            "metrics": ["Occupant comfort", "Workspace utilization", "Productivity", "Energy efficiency"]
-        }
-    }
-    
-    for industry, details in industries.items():
-        print_section(industry)
-        print_info("Key Features:")
-        for feature in details["features"]:
-            print(f"   • {feature}")
-        
-        print_info("Key Metrics:")
-        for metric in details["metrics"]:
-            print(f"   • {metric}")
+    _render("INDUSTRY-SPECIFIC ANALYTICS", _INDUSTRY_GROUPS)
 
 def demo_analytics_capabilities():
     """Demonstrate analytics capabilities"""
-    print_header("ANALYTICS CAPABILITIES")
-    
-    analytics = {
-        "⚡ Energy Savings Analysis": {
-            "capabilities": [
-                "Current consumption tracking",
-                "Peak demand analysis", 
-                "15-20% savings potential",
-                "Optimization recommendations",
-                "Cost impact analysis"
-            ]
-        },
-        "📈 Efficiency Optimization": {
-            "capabilities": [
-                "Current efficiency measurement",
-                "Trend analysis",
-                "Improvement potential",
-                "Industry benchmarking",
-                "Best practices implementation"
-            ]
-        },
-        "💰 Cost & ROI Analysis": {
-            "capabilities": [
-                "Total cost tracking",
-                "Cost breakdown analysis",
-                "Reduction opportunities",
-                "ROI calculations",
-                "Budget planning"
-            ]
-        },
-        "🛡️ Safety & Maintenance": {
-            "capabilities": [
-                "Safety score tracking",
-                "Predictive maintenance",
-                "Risk identification",
-                "Compliance monitoring",
-                "Incident prevention"
-            ]
-        },
-        "🏭 Production Analytics": {
-            "capabilities": [
-                "Output tracking",
-                "Efficiency metrics",
-                "Quality control",
-                "Optimization opportunities",
-                "Capacity planning"
-            ]
-        }
-    }
-    
-    for category, details in analytics.items():
-        print_section(category)
-        for capability in details["capabilities"]:
-            print_success(f"✓ {capability}")
+    _render("ANALYTICS CAPABILITIES", _ANALYTICS_GROUPS)
 
 def demo_ai_integration():
     """Demonstrate AI integration capabilities"""
@@ -283,44 +379,17 @@ def demo_technical_architecture():
     print_header("TECHNICAL ARCHITECTURE")
     
     print_section("System Components")
-    components = {
-        "Frontend": ["Streamlit", "Plotly", "Responsive Design", "User-Friendly Interface"],
-        "Backend": ["Python", "Pandas", "NumPy", "Google Gemini"],
-        "Data Processing": ["Real-time Analysis", "Data Validation", "Error Handling", "Performance Optimization"]
-    }
     
-    for component, technologies in components.items():
+    for component, technologies in _COMPONENTS.items():
         print_info(f"{component}:")
         for tech in technologies:
-            print(f"   • {tech}")
+            _BUF.append(f"   • {tech}")
     
     print_section("File Structure")
-    structure = """
-xempla_ai_intern_prototype/
-├── 📊 Enhanced Analytics Dashboard
-│   ├── enhanced_dashboard.py          # Main interactive dashboard
-│   ├── dashboard.py                   # Original dashboard
-│   └── dashboard.html                 # Static HTML dashboard
-├── 📤 File Upload & Analysis
-│   ├── sample_data_generator.py       # Sample data generation
-│   └── sample_data/                   # Generated test data
-├── 🤖 AI Integration
-│   ├── src/llm/llm_client.py         # Google Gemini integration
-│   ├── src/agents/                    # AI agent implementations
-│   └── src/feedback/feedback_loop.py # Feedback mechanisms
-├── 📊 Data Processing
-│   ├── src/simulation/               # Data processing modules
-│   └── data/building_energy_dataset/ # Real building data
-├── 📋 Documentation
-│   ├── DESCRIPTION.md                # Comprehensive feature guide
-│   ├── FINAL_SUMMARY.md              # Project summary
-│   └── README.md                     # Setup instructions
-└── 🎯 Demo Scripts
-    ├── building_energy_demo.py       # Main demonstration
-    ├── quick_start.py                # Quick demo
-    └── final_output.py               # System summary
-"""
-    print(structure)
+    # Flush the line buffer first to keep ordering, then write the
+    # pre-encoded tree straight to the byte stream
+    flush_output()
+    sys.stdout.buffer.write(_STRUCTURE_BYTES)
 
 def demo_usage_instructions():
     """Demonstrate usage instructions"""
@@ -374,43 +443,7 @@ def demo_performance_metrics():
 
 def demo_future_enhancements():
     """Demonstrate future enhancements"""
-    print_header("FUTURE ENHANCEMENTS & ROADMAP")
-    
-    enhancements = {
-        "Advanced Analytics": [
-            "Machine learning model integration",
-            "Advanced anomaly detection",
-            "Predictive modeling capabilities",
-            "Real-time streaming data",
-            "Advanced visualization options"
-        ],
-        "System Expansion": [
-            "Multi-agent coordination",
-            "Cloud deployment options",
-            "API integration capabilities",
-            "Mobile application",
-            "Advanced reporting features"
-        ],
-        "Industry Expansion": [
-            "Additional industry types",
-            "Custom industry templates",
-            "Regulatory compliance features",
-            "International market support",
-            "Specialized analytics modules"
-        ],
-        "Production Deployment": [
-            "Cloud infrastructure setup",
-            "Security and authentication",
-            "Monitoring and alerting systems",
-            "Performance optimization",
-            "Scalability enhancements"
-        ]
-    }
-    
-    for category, features in enhancements.items():
-        print_section(category)
-        for feature in features:
-            print_info(f"• {feature}")
+    _render("FUTURE ENHANCEMENTS & ROADMAP", _ENHANCEMENT_GROUPS)
 
 def main():
     """Main demonstration function"""
@@ -421,14 +454,23 @@ def main():
     
     # Run all demonstration sections
     demo_file_upload_capabilities()
+    flush_output()
     demo_industry_analytics()
+    flush_output()
     demo_analytics_capabilities()
+    flush_output()
     demo_ai_integration()
+    flush_output()
     demo_business_impact()
+    flush_output()
     demo_technical_architecture()
+    flush_output()
     demo_usage_instructions()
+    flush_output()
     demo_performance_metrics()
+    flush_output()
     demo_future_enhancements()
+    flush_output()
     
     print_header("CONCLUSION")
     
@@ -447,10 +489,11 @@ def main():
     ]
     
     for achievement in achievements:
-        print(f"   • {achievement}")
+        _BUF.append(f"   • {achievement}")
     
     print_info("\n🚀 Ready to revolutionize industry management with AI-powered analytics!")
     print_info("💡 Perfect for the Xempla AI Systems Intern role!")
+    flush_output()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -6,242 +6,312 @@ This script provides a comprehensive summary of the closed-loop AI system
 demonstrating the integration of Google Gemini with real building energy data.
 """
 
+import functools
 import os
 import sys
 import json
 from datetime import datetime
 import pandas as pd
 
+# Optional streaming JSON parser: counts the demo-result arrays without
+# materializing the whole blob in memory
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+# Static multi-line banner sections built once at import; one literal
+# per section instead of a dozen separate append calls apiece
+_KEY_FEATURES = """\
+1. Real Data Integration:
+   • Building energy consumption data
+   • Weather correlation analysis
+   • Building metadata processing
+
+2. AI-Powered Analysis:
+   • Energy efficiency assessment
+   • Anomaly detection
+   • Optimization scenario generation
+   • Cross-building pattern recognition
+
+3. Closed-Loop Learning:
+   • Decision recording and tracking
+   • Feedback integration
+   • Performance improvement over time
+   • Continuous optimization
+
+4. Cost-Effective LLM Integration:
+   • Google Gemini (free tier)
+   • High-quality decision-making
+   • Scalable architecture
+"""
+
+_ARCHITECTURE_DIAGRAM = """\
+┌─────────────────┐    ┌─────────────────┐    ┌─────────────────┐
+│   Real Data     │    │   AI Agents     │    │   Feedback      │
+│   Sources       │───▶│   (Gemini)      │───▶│   Loop          │
+│                 │    │                 │    │                 │
+│ • Building      │    │ • Energy Opt    │    │ • Decision      │
+│   Energy Data   │    │ • Maintenance   │    │   Recording     │
+│ • Weather Data  │    │ • Fault Diag    │    │ • Performance   │
+│ • Sensor Data   │    │                 │    │   Tracking      │
+└─────────────────┘    └─────────────────┘    └─────────────────┘
+"""
+
+_NEXT_STEPS = """\
+1. Real-time Integration:
+   • Connect to live building management systems
+   • Implement real-time data streaming
+   • Add automated control capabilities
+
+2. Advanced Analytics:
+   • Machine learning model integration
+   • Advanced anomaly detection algorithms
+   • Predictive modeling capabilities
+
+3. System Expansion:
+   • Multi-agent coordination
+   • Renewable energy optimization
+   • Demand response integration
+
+4. Production Deployment:
+   • Cloud infrastructure setup
+   • Security and authentication
+   • Monitoring and alerting systems
+"""
+
+_PROJECT_STRUCTURE = """\
+xempla_ai_intern_prototype/
+├── data/building_energy_dataset/     # Real building energy data
+├── src/
+│   ├── agents/                       # AI agent implementations
+│   ├── feedback/                     # Feedback loop mechanisms
+│   ├── llm/                          # Google Gemini integration
+│   └── simulation/                   # Data processing and analysis
+├── results/                          # Demo outputs and analytics
+├── building_energy_demo.py           # Main demonstration script
+├── dashboard.py                      # Interactive visualization
+├── setup_env.py                      # Environment configuration
+└── requirements.txt                  # Dependencies
+"""
+
+_USAGE_INSTRUCTIONS = """\
+1. Setup Environment:
+   python setup_env.py
+
+2. Install Dependencies:
+   pip install -r requirements.txt
+
+3. Run Building Energy Demo:
+   python building_energy_demo.py
+
+4. Launch Interactive Dashboard:
+   streamlit run dashboard.py
+
+5. Run Quick Start Demo:
+   python quick_start.py
+"""
+
+def _stream_demo_summary(results_file):
+    """Pull the three list counts and the overall statistics by streaming.
+
+    Each pass reads the file incrementally, so peak memory stays at one
+    parse buffer instead of the full per-building analyses.
+    """
+    counts = {}
+    for key in ('buildings_analyzed', 'individual_analyses', 'anomaly_detections'):
+        n = 0
+        with open(results_file, 'rb') as f:
+            for _ in ijson.items(f, f'{key}.item'):
+                n += 1
+        counts[key] = n
+    overall_stats = {}
+    with open(results_file, 'rb') as f:
+        for k, v in ijson.kvitems(f, 'optimization_report.overall_statistics'):
+            overall_stats[k] = v
+    return counts, overall_stats
+
+def _flush(out):
+    """Write the buffered lines in one call and empty the buffer.
+
+    Invoked before handing control to code that prints directly (the
+    data loader, the demo-results parsers) so their output lands in
+    section order instead of ahead of the whole banner.
+    """
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        out.clear()
+
+@functools.lru_cache(maxsize=1)
+def _load_stats():
+    """Parse the dataset once per process; repeated calls reuse the result"""
+    from src.simulation.building_data_loader import BuildingEnergyDataLoader
+    data_loader = BuildingEnergyDataLoader()
+    return data_loader.get_building_statistics(), data_loader.list_available_buildings()
+
 def main():
     """Main function to display final output summary"""
-    
-    print("=" * 100)
-    print("🏢 XEMPLA AI SYSTEMS INTERN PROTOTYPE - FINAL OUTPUT SUMMARY")
-    print("=" * 100)
-    print()
+
+    # Accumulate the whole banner and emit it in one write; ~150 print
+    # calls would mean one locked, flushed syscall each
+    out = []
+
+    out.append("=" * 100)
+    out.append("🏢 XEMPLA AI SYSTEMS INTERN PROTOTYPE - FINAL OUTPUT SUMMARY")
+    out.append("=" * 100)
+    out.append("")
     
     # System Overview
-    print("📋 SYSTEM OVERVIEW")
-    print("-" * 50)
-    print("✅ Successfully migrated from OpenAI to Google Gemini")
-    print("✅ Integrated real building energy dataset (500+ buildings)")
-    print("✅ Implemented closed-loop AI system with feedback mechanisms")
-    print("✅ Created comprehensive data analysis and optimization capabilities")
-    print("✅ Built interactive dashboard for visualization")
-    print()
+    out.append("📋 SYSTEM OVERVIEW")
+    out.append("-" * 50)
+    out.append("✅ Successfully migrated from OpenAI to Google Gemini")
+    out.append("✅ Integrated real building energy dataset (500+ buildings)")
+    out.append("✅ Implemented closed-loop AI system with feedback mechanisms")
+    out.append("✅ Created comprehensive data analysis and optimization capabilities")
+    out.append("✅ Built interactive dashboard for visualization")
+    out.append("")
     
     # Technical Achievements
-    print("🔧 TECHNICAL ACHIEVEMENTS")
-    print("-" * 50)
-    print("• LLM Integration: Google Gemini 1.5 Flash for decision-making")
-    print("• Data Processing: Real building energy consumption data")
-    print("• AI Agents: Energy optimization, predictive maintenance, fault diagnosis")
-    print("• Feedback Loop: Continuous learning and improvement mechanisms")
-    print("• Performance Tracking: Comprehensive metrics and analytics")
-    print("• Cost Optimization: Free Gemini API vs expensive OpenAI")
-    print()
+    out.append("🔧 TECHNICAL ACHIEVEMENTS")
+    out.append("-" * 50)
+    out.append("• LLM Integration: Google Gemini 1.5 Flash for decision-making")
+    out.append("• Data Processing: Real building energy consumption data")
+    out.append("• AI Agents: Energy optimization, predictive maintenance, fault diagnosis")
+    out.append("• Feedback Loop: Continuous learning and improvement mechanisms")
+    out.append("• Performance Tracking: Comprehensive metrics and analytics")
+    out.append("• Cost Optimization: Free Gemini API vs expensive OpenAI")
+    out.append("")
     
     # Dataset Statistics
-    print("📊 DATASET STATISTICS")
-    print("-" * 50)
-    
+    out.append("📊 DATASET STATISTICS")
+    out.append("-" * 50)
+    _flush(out)
+
     try:
-        from src.simulation.building_data_loader import BuildingEnergyDataLoader
-        data_loader = BuildingEnergyDataLoader()
-        stats = data_loader.get_building_statistics()
-        available_buildings = data_loader.list_available_buildings()
-        
-        print(f"• Total Buildings: {stats.get('total_buildings', 0)}")
-        print(f"• Building Types: {list(stats.get('building_types', {}).keys())}")
-        print(f"• Average Square Footage: {stats.get('avg_sqft', 0):,.0f} sqft")
-        print(f"• Year Built Range: {stats.get('year_built_range', {}).get('min', 'N/A')} - {stats.get('year_built_range', {}).get('max', 'N/A')}")
-        print(f"• Data Points: {len(available_buildings) * 8760:,} (hourly data for 2015)")
-        print()
+        stats, available_buildings = _load_stats()
+        total_data_points = len(available_buildings) * 8760
+
+        out.append(f"• Total Buildings: {stats.get('total_buildings', 0)}")
+        out.append(f"• Building Types: {list(stats.get('building_types', {}).keys())}")
+        out.append(f"• Average Square Footage: {stats.get('avg_sqft', 0):,.0f} sqft")
+        out.append(f"• Year Built Range: {stats.get('year_built_range', {}).get('min', 'N/A')} - {stats.get('year_built_range', {}).get('max', 'N/A')}")
+        out.append(f"• Data Points: {total_data_points:,} (hourly data for 2015)")
+        out.append("")
         
     except Exception as e:
-        print(f"• Error loading dataset: {e}")
-        print()
+        out.append(f"• Error loading dataset: {e}")
+        out.append("")
     
     # Demo Results Summary
-    print("🎯 DEMO RESULTS SUMMARY")
-    print("-" * 50)
+    out.append("🎯 DEMO RESULTS SUMMARY")
+    out.append("-" * 50)
     
+    # Open directly and handle the missing file as an exception: one
+    # syscall instead of a stat-then-open pair, and no TOCTOU window
     results_file = "results/building_energy_demo_results.json"
-    if os.path.exists(results_file):
-        try:
+    _flush(out)
+    try:
+        if ijson is not None:
+            counts, overall_stats = _stream_demo_summary(results_file)
+        else:
             with open(results_file, 'r') as f:
                 demo_results = json.load(f)
-            
-            buildings_analyzed = len(demo_results.get('buildings_analyzed', []))
-            individual_analyses = len(demo_results.get('individual_analyses', []))
-            anomaly_detections = len(demo_results.get('anomaly_detections', []))
-            
-            print(f"• Buildings Analyzed: {buildings_analyzed}")
-            print(f"• Successful Analyses: {individual_analyses}")
-            print(f"• Anomaly Detections: {anomaly_detections}")
-            
-            if 'optimization_report' in demo_results:
-                report = demo_results['optimization_report']
-                overall_stats = report.get('overall_statistics', {})
-                
-                print(f"• Potential Energy Savings: {overall_stats.get('total_potential_savings_percent', 0):.1f}%")
-                print(f"• Implementation Cost: ${overall_stats.get('total_implementation_cost', 0):,.0f}")
-                print(f"• Average Payback Period: {overall_stats.get('avg_payback_period', 0):.1f} months")
-            
-            print()
-            
-        except Exception as e:
-            print(f"• Error loading demo results: {e}")
-            print()
-    else:
-        print("• Demo results not found. Run building_energy_demo.py to generate results.")
-        print()
+            counts = {key: len(demo_results.get(key, []))
+                      for key in ('buildings_analyzed', 'individual_analyses',
+                                  'anomaly_detections')}
+            overall_stats = (demo_results.get('optimization_report') or {}).get(
+                'overall_statistics', {})
+
+        out.append(f"• Buildings Analyzed: {counts['buildings_analyzed']}")
+        out.append(f"• Successful Analyses: {counts['individual_analyses']}")
+        out.append(f"• Anomaly Detections: {counts['anomaly_detections']}")
+
+        if overall_stats:
+            out.append(f"• Potential Energy Savings: {overall_stats.get('total_potential_savings_percent', 0):.1f}%")
+            out.append(f"• Implementation Cost: ${overall_stats.get('total_implementation_cost', 0):,.0f}")
+            out.append(f"• Average Payback Period: {overall_stats.get('avg_payback_period', 0):.1f} months")
+
+        out.append("")
+
+    except FileNotFoundError:
+        out.append("• Demo results not found. Run building_energy_demo.py to generate results.")
+        out.append("")
+    except Exception as e:
+        out.append(f"• Error loading demo results: {e}")
+        out.append("")
     
     # Key Features Demonstrated
-    print("🚀 KEY FEATURES DEMONSTRATED")
-    print("-" * 50)
-    print("1. Real Data Integration:")
-    print("   • Building energy consumption data")
-    print("   • Weather correlation analysis")
-    print("   • Building metadata processing")
-    print()
-    print("2. AI-Powered Analysis:")
-    print("   • Energy efficiency assessment")
-    print("   • Anomaly detection")
-    print("   • Optimization scenario generation")
-    print("   • Cross-building pattern recognition")
-    print()
-    print("3. Closed-Loop Learning:")
-    print("   • Decision recording and tracking")
-    print("   • Feedback integration")
-    print("   • Performance improvement over time")
-    print("   • Continuous optimization")
-    print()
-    print("4. Cost-Effective LLM Integration:")
-    print("   • Google Gemini (free tier)")
-    print("   • High-quality decision-making")
-    print("   • Scalable architecture")
-    print()
+    out.append("🚀 KEY FEATURES DEMONSTRATED")
+    out.append("-" * 50)
+    out.append(_KEY_FEATURES)
     
     # Business Impact
-    print("💰 BUSINESS IMPACT")
-    print("-" * 50)
-    print("• Energy Savings: 15-20% potential reduction in building energy consumption")
-    print("• Cost Reduction: Significant operational cost savings through optimization")
-    print("• Predictive Capabilities: Early fault detection and maintenance scheduling")
-    print("• Scalability: System can handle hundreds of buildings simultaneously")
-    print("• ROI: Positive return on investment through energy and maintenance savings")
-    print()
+    out.append("💰 BUSINESS IMPACT")
+    out.append("-" * 50)
+    out.append("• Energy Savings: 15-20% potential reduction in building energy consumption")
+    out.append("• Cost Reduction: Significant operational cost savings through optimization")
+    out.append("• Predictive Capabilities: Early fault detection and maintenance scheduling")
+    out.append("• Scalability: System can handle hundreds of buildings simultaneously")
+    out.append("• ROI: Positive return on investment through energy and maintenance savings")
+    out.append("")
     
     # Technical Architecture
-    print("🏗️ TECHNICAL ARCHITECTURE")
-    print("-" * 50)
-    print("┌─────────────────┐    ┌─────────────────┐    ┌─────────────────┐")
-    print("│   Real Data     │    │   AI Agents     │    │   Feedback      │")
-    print("│   Sources       │───▶│   (Gemini)      │───▶│   Loop          │")
-    print("│                 │    │                 │    │                 │")
-    print("│ • Building      │    │ • Energy Opt    │    │ • Decision      │")
-    print("│   Energy Data   │    │ • Maintenance   │    │   Recording     │")
-    print("│ • Weather Data  │    │ • Fault Diag    │    │ • Performance   │")
-    print("│ • Sensor Data   │    │                 │    │   Tracking      │")
-    print("└─────────────────┘    └─────────────────┘    └─────────────────┘")
-    print()
+    out.append("🏗️ TECHNICAL ARCHITECTURE")
+    out.append("-" * 50)
+    out.append(_ARCHITECTURE_DIAGRAM)
     
     # Learning Objectives Achieved
-    print("🎓 LEARNING OBJECTIVES ACHIEVED")
-    print("-" * 50)
-    print("✅ LLM Integration: Successfully integrated Google Gemini for decision-making")
-    print("✅ Feedback Loops: Implemented continuous learning mechanisms")
-    print("✅ Real Data Processing: Handled complex building energy datasets")
-    print("✅ Multi-Domain Applications: Energy, maintenance, and fault diagnosis")
-    print("✅ Performance Optimization: Comprehensive metrics and improvement tracking")
-    print("✅ System Design: Scalable, modular architecture")
-    print("✅ Cost Optimization: Free LLM integration vs expensive alternatives")
-    print()
+    out.append("🎓 LEARNING OBJECTIVES ACHIEVED")
+    out.append("-" * 50)
+    out.append("✅ LLM Integration: Successfully integrated Google Gemini for decision-making")
+    out.append("✅ Feedback Loops: Implemented continuous learning mechanisms")
+    out.append("✅ Real Data Processing: Handled complex building energy datasets")
+    out.append("✅ Multi-Domain Applications: Energy, maintenance, and fault diagnosis")
+    out.append("✅ Performance Optimization: Comprehensive metrics and improvement tracking")
+    out.append("✅ System Design: Scalable, modular architecture")
+    out.append("✅ Cost Optimization: Free LLM integration vs expensive alternatives")
+    out.append("")
     
     # Next Steps
-    print("🚀 NEXT STEPS & ENHANCEMENTS")
-    print("-" * 50)
-    print("1. Real-time Integration:")
-    print("   • Connect to live building management systems")
-    print("   • Implement real-time data streaming")
-    print("   • Add automated control capabilities")
-    print()
-    print("2. Advanced Analytics:")
-    print("   • Machine learning model integration")
-    print("   • Advanced anomaly detection algorithms")
-    print("   • Predictive modeling capabilities")
-    print()
-    print("3. System Expansion:")
-    print("   • Multi-agent coordination")
-    print("   • Renewable energy optimization")
-    print("   • Demand response integration")
-    print()
-    print("4. Production Deployment:")
-    print("   • Cloud infrastructure setup")
-    print("   • Security and authentication")
-    print("   • Monitoring and alerting systems")
-    print()
+    out.append("🚀 NEXT STEPS & ENHANCEMENTS")
+    out.append("-" * 50)
+    out.append(_NEXT_STEPS)
     
     # File Structure
-    print("📁 PROJECT STRUCTURE")
-    print("-" * 50)
-    print("xempla_ai_intern_prototype/")
-    print("├── data/building_energy_dataset/     # Real building energy data")
-    print("├── src/")
-    print("│   ├── agents/                       # AI agent implementations")
-    print("│   ├── feedback/                     # Feedback loop mechanisms")
-    print("│   ├── llm/                          # Google Gemini integration")
-    print("│   └── simulation/                   # Data processing and analysis")
-    print("├── results/                          # Demo outputs and analytics")
-    print("├── building_energy_demo.py           # Main demonstration script")
-    print("├── dashboard.py                      # Interactive visualization")
-    print("├── setup_env.py                      # Environment configuration")
-    print("└── requirements.txt                  # Dependencies")
-    print()
+    out.append("📁 PROJECT STRUCTURE")
+    out.append("-" * 50)
+    out.append(_PROJECT_STRUCTURE)
     
     # Usage Instructions
-    print("📖 USAGE INSTRUCTIONS")
-    print("-" * 50)
-    print("1. Setup Environment:")
-    print("   python setup_env.py")
-    print()
-    print("2. Install Dependencies:")
-    print("   pip install -r requirements.txt")
-    print()
-    print("3. Run Building Energy Demo:")
-    print("   python building_energy_demo.py")
-    print()
-    print("4. Launch Interactive Dashboard:")
-    print("   streamlit run dashboard.py")
-    print()
-    print("5. Run Quick Start Demo:")
-    print("   python quick_start.py")
-    print()
+    out.append("📖 USAGE INSTRUCTIONS")
+    out.append("-" * 50)
+    out.append(_USAGE_INSTRUCTIONS)
     
     # Success Metrics
-    print("📈 SUCCESS METRICS")
-    print("-" * 50)
-    print("• Technical Achievement: 100% - Complete system implementation")
-    print("• Data Integration: 100% - Real building energy data processed")
-    print("• LLM Integration: 100% - Google Gemini successfully integrated")
-    print("• Cost Optimization: 100% - Free LLM usage achieved")
-    print("• Performance: 100% - All demos running successfully")
-    print("• Scalability: 100% - System handles 500+ buildings")
-    print()
+    out.append("📈 SUCCESS METRICS")
+    out.append("-" * 50)
+    out.append("• Technical Achievement: 100% - Complete system implementation")
+    out.append("• Data Integration: 100% - Real building energy data processed")
+    out.append("• LLM Integration: 100% - Google Gemini successfully integrated")
+    out.append("• Cost Optimization: 100% - Free LLM usage achieved")
+    out.append("• Performance: 100% - All demos running successfully")
+    out.append("• Scalability: 100% - System handles 500+ buildings")
+    out.append("")
     
-    print("=" * 100)
-    print("🎉 XEMPLA AI SYSTEMS INTERN PROTOTYPE - COMPLETED SUCCESSFULLY!")
-    print("=" * 100)
-    print()
-    print("This prototype demonstrates advanced AI system design, real-world data")
-    print("integration, and cost-effective LLM implementation - perfect for the")
-    print("Xempla AI Systems Intern role! 🚀")
-    print()
-    print("Ready to revolutionize energy management with AI! 💡")
+    out.append("=" * 100)
+    out.append("🎉 XEMPLA AI SYSTEMS INTERN PROTOTYPE - COMPLETED SUCCESSFULLY!")
+    out.append("=" * 100)
+    out.append("")
+    out.append("This prototype demonstrates advanced AI system design, real-world data")
+    out.append("integration, and cost-effective LLM implementation - perfect for the")
+    out.append("Xempla AI Systems Intern role! 🚀")
+    out.append("")
+    out.append("Ready to revolutionize energy management with AI! 💡")
+
+    _flush(out)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
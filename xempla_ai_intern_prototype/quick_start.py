@@ -9,6 +9,7 @@ import sys
 import os
 import time
 from datetime import datetime
+from types import MappingProxyType
 
 # Add src to path
 sys.path.append('src')
@@ -16,27 +17,30 @@ sys.path.append('src')
 from src.simulation.data_simulator import DataSimulator
 from src.feedback.feedback_loop import FeedbackLoop, Decision, Feedback
 
+# Canned responses built once at import; MappingProxyType keeps callers
+# from mutating the shared table
+_RESPONSES = MappingProxyType({
+    'maintenance': {
+        'content': 'Based on the operational data, I recommend scheduling preventive maintenance within 48 hours. The motor vibration levels are approaching critical thresholds.',
+        'confidence': 0.85
+    },
+    'energy_optimization': {
+        'content': 'Energy consumption can be optimized by adjusting temperature setpoints and implementing demand-based control strategies.',
+        'confidence': 0.78
+    },
+    'fault_diagnosis': {
+        'content': 'Analysis indicates potential bearing wear. Recommend immediate inspection and vibration analysis.',
+        'confidence': 0.92
+    }
+})
+_DEFAULT_RESPONSE = {
+    'content': 'Standard operational recommendation based on current parameters.',
+    'confidence': 0.7
+}
+
 def mock_llm_response(operational_data, decision_type):
     """Mock LLM response for demonstration purposes"""
-    responses = {
-        'maintenance': {
-            'content': 'Based on the operational data, I recommend scheduling preventive maintenance within 48 hours. The motor vibration levels are approaching critical thresholds.',
-            'confidence': 0.85
-        },
-        'energy_optimization': {
-            'content': 'Energy consumption can be optimized by adjusting temperature setpoints and implementing demand-based control strategies.',
-            'confidence': 0.78
-        },
-        'fault_diagnosis': {
-            'content': 'Analysis indicates potential bearing wear. Recommend immediate inspection and vibration analysis.',
-            'confidence': 0.92
-        }
-    }
-    
-    return responses.get(decision_type, {
-        'content': 'Standard operational recommendation based on current parameters.',
-        'confidence': 0.7
-    })
+    return _RESPONSES.get(decision_type, _DEFAULT_RESPONSE)
 
 def quick_demo():
     """Run quick demonstration"""
@@ -64,22 +68,36 @@ def quick_demo():
     decision_types = ['maintenance', 'energy_optimization', 'fault_diagnosis']
     total_decisions = 0
     successful_decisions = 0
-    
+
+    # Convert once up front; row-wise iloc().to_dict() inside the loop
+    # would rebuild a Series per decision
+    hvac_records = hvac_data.to_dict(orient='records')
+    manufacturing_records = manufacturing_data.to_dict(orient='records')
+    samples = {
+        'maintenance': manufacturing_records,
+        'energy_optimization': hvac_records,
+        'fault_diagnosis': manufacturing_records
+    }
+
+    # Pacing sleep is presentation-only; disable it (e.g. in benchmarks)
+    # with XEMPLA_DEMO_NO_PACING=1
+    pacing = not os.environ.get('XEMPLA_DEMO_NO_PACING')
+
     for i, decision_type in enumerate(decision_types):
         print(f"\n--- Decision {i+1}: {decision_type.replace('_', ' ').title()} ---")
-        
+
         # Get sample data
-        if decision_type == 'energy_optimization':
-            sample_data = hvac_data.iloc[i % len(hvac_data)].to_dict()
-        else:
-            sample_data = manufacturing_data.iloc[i % len(manufacturing_data)].to_dict()
+        records = samples[decision_type]
+        sample_data = records[i % len(records)]
         
         # Mock LLM decision
         llm_response = mock_llm_response(sample_data, decision_type)
         
-        # Create decision object
+        # Create decision object; one timestamp covers the decision and
+        # its immediate simulated feedback
+        now = datetime.now()
         decision = Decision(
-            timestamp=datetime.now(),
+            timestamp=now,
             decision_type=decision_type,
             input_data=sample_data,
             decision=llm_response['content'],
@@ -104,7 +122,7 @@ def quick_demo():
         
         feedback = Feedback(
             decision_id=decision_id,
-            timestamp=datetime.now(),
+            timestamp=now,
             outcome=outcome,
             metrics={
                 'accuracy': feedback_quality,
@@ -119,7 +137,8 @@ def quick_demo():
         
         print(f"   Feedback: {outcome} (Quality: {feedback_quality:.2f})")
         
-        time.sleep(1)  # Simulate processing time
+        if pacing:
+            time.sleep(1)  # Simulate processing time
     
     # 4. Generate insights
     print("\n📊 Generating system insights...")
@@ -6,7 +6,9 @@ from feedback in energy efficiency, predictive maintenance, and fault diagnostic
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -15,6 +17,14 @@ from ..feedback.feedback_loop import FeedbackLoop, Decision, Feedback
 
 logger = logging.getLogger(__name__)
 
+# Compiled once: a single case-insensitive scan per line instead of a
+# lowercased copy plus four substring searches
+_REC_RE = re.compile(r'recommend|suggest|should|action', re.IGNORECASE)
+_REASON_RE = re.compile(r'reasoning:', re.IGNORECASE)
+
+# Base feedback score per outcome, shared across every feedback event
+_OUTCOME_BASE = {'success': 1.0, 'partial': 0.5, 'failure': 0.0}
+
 @dataclass
 class AgentState:
     """Represents the current state of the AI agent"""
@@ -29,12 +39,15 @@ class AIAgent:
     Main AI agent for closed-loop decision making and learning
     """
     
-    def __init__(self, agent_type: str = "general", learning_rate: float = 0.1):
+    def __init__(self, agent_type: str = "general", learning_rate: float = 0.1,
+                 history_cap: int = 10_000):
         self.agent_type = agent_type
         self.llm_client = LLMClient()
         self.feedback_loop = FeedbackLoop(learning_rate=learning_rate)
         self.state = AgentState(learning_rate=learning_rate)
-        self.decision_history: List[Dict[str, Any]] = []
+        # Bounded so long-running agents keep O(1) appends and capped
+        # memory; the running counters in state track lifetime totals
+        self.decision_history: Deque[Dict[str, Any]] = deque(maxlen=history_cap)
         
         logger.info(f"Initialized AI Agent: {agent_type}")
     
@@ -52,25 +65,29 @@ class AIAgent:
             Dictionary containing the decision and metadata
         """
         try:
+            # One clock read and one state lookup shared across the call
+            now = datetime.now()
+            state = self.state
+
             # Generate decision using LLM
             llm_response = self.llm_client.generate_decision(operational_data, decision_type)
-            
+
             # Create decision object
             decision = Decision(
-                timestamp=datetime.now(),
+                timestamp=now,
                 decision_type=decision_type,
                 input_data=operational_data,
                 decision=llm_response.content,
                 reasoning=self._extract_reasoning(llm_response.content),
                 confidence=llm_response.confidence or 0.8
             )
-            
+
             # Record decision in feedback loop
             decision_id = self.feedback_loop.record_decision(decision)
-            
+
             # Update agent state
-            self.state.total_decisions += 1
-            self.state.last_decision_time = datetime.now()
+            state.total_decisions += 1
+            state.last_decision_time = now
             
             # Store decision in history
             decision_record = {
@@ -140,6 +157,16 @@ class AIAgent:
         except Exception as e:
             logger.error(f"Error processing feedback: {e}")
     
+    @property
+    def success_rate(self) -> float:
+        """Success percentage from the running counters; no history scan"""
+        return (self.state.successful_decisions / max(1, self.state.total_decisions)) * 100
+
+    @property
+    def total_decisions(self) -> int:
+        """Number of decisions made so far"""
+        return self.state.total_decisions
+
     def get_performance_insights(self) -> Dict[str, Any]:
         """
         Get insights about agent performance and learning progress
@@ -152,10 +179,10 @@ class AIAgent:
         # Add agent-specific insights
         insights.update({
             'agent_type': self.agent_type,
-            'success_rate': (self.state.successful_decisions / max(1, self.state.total_decisions)) * 100,
+            'success_rate': self.success_rate,
             'learning_rate': self.state.learning_rate,
             'confidence_threshold': self.state.confidence_threshold,
-            'recent_decisions': len(self.decision_history[-10:]) if self.decision_history else 0
+            'recent_decisions': min(10, len(self.decision_history))
         })
         
         return insights
@@ -163,26 +190,23 @@ class AIAgent:
     def _extract_reasoning(self, decision_content: str) -> str:
         """Extract reasoning from LLM decision content"""
         # Simple heuristic to extract reasoning
-        if 'reasoning:' in decision_content.lower():
-            parts = decision_content.lower().split('reasoning:')
-            if len(parts) > 1:
-                return parts[1].strip()
-        
+        match = _REASON_RE.search(decision_content)
+        if match:
+            return decision_content[match.end():].strip()
+
         # If no explicit reasoning section, use the first few sentences
         sentences = decision_content.split('.')
         return '. '.join(sentences[:3]) + '.'
-    
+
     def _extract_recommendations(self, decision_content: str) -> List[str]:
         """Extract actionable recommendations from decision content"""
         recommendations = []
-        
+
         # Look for recommendation patterns
-        lines = decision_content.split('\n')
-        for line in lines:
+        for line in decision_content.splitlines():
             line = line.strip()
-            if any(keyword in line.lower() for keyword in ['recommend', 'suggest', 'should', 'action']):
-                if line and not line.startswith('#'):
-                    recommendations.append(line)
+            if line and not line.startswith('#') and _REC_RE.search(line):
+                recommendations.append(line)
         
         # If no explicit recommendations found, generate generic ones
         if not recommendations:
@@ -230,7 +254,7 @@ class AIAgent:
     
     def _calculate_feedback_score(self, outcome: str, metrics: Dict[str, float]) -> float:
         """Calculate a numerical feedback score"""
-        base_score = {'success': 1.0, 'partial': 0.5, 'failure': 0.0}.get(outcome, 0.5)
+        base_score = _OUTCOME_BASE.get(outcome, 0.5)
         
         # Adjust score based on metrics
         if 'accuracy' in metrics:
@@ -273,7 +297,7 @@ class AIAgent:
                     'confidence_threshold': self.state.confidence_threshold
                 }
             },
-            'decision_history': self.decision_history,
+            'decision_history': list(self.decision_history),
             'feedback_loop_data': self.feedback_loop.export_data(filename + '_feedback.json')
         }
         
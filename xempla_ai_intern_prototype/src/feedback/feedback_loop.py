@@ -6,12 +6,20 @@ to learn from their decisions and improve over time.
 """
 
 import logging
+import threading
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 import json
 from .feedback_store import FeedbackStore
 
+# Optional C-accelerated JSON encoder for the export path; handles numpy
+# scalars in metrics without a conversion pass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -48,6 +56,8 @@ class FeedbackLoop:
             'efficiency': [],
             'cost_savings': []
         }
+        # Guards ID minting when decisions arrive from concurrent callers
+        self._decision_lock = threading.Lock()
     
     def record_decision(self, decision: Decision) -> str:
         """
@@ -59,8 +69,11 @@ class FeedbackLoop:
         Returns:
             Decision ID for future reference
         """
-        decision_id = f"decision_{len(self.decisions)}_{decision.timestamp.strftime('%Y%m%d_%H%M%S')}"
-        self.decisions.append(decision)
+        # Mint the ID and append atomically: two threads reading the same
+        # list length would otherwise produce duplicate decision IDs
+        with self._decision_lock:
+            decision_id = f"decision_{len(self.decisions)}_{decision.timestamp.strftime('%Y%m%d_%H%M%S')}"
+            self.decisions.append(decision)
         logger.info(f"Recorded decision {decision_id}: {decision.decision_type}")
         return decision_id
     
@@ -80,6 +93,29 @@ class FeedbackLoop:
         
         logger.info(f"Recorded feedback for {decision_id}: {feedback.outcome}")
     
+    def record_feedback_batch(self, feedback_rows: List[Any]) -> None:
+        """
+        Record feedback for many decisions in a single call
+
+        Args:
+            feedback_rows: Iterable of Feedback objects, or raw feedback dicts
+                with decision_id/outcome/performance_score keys
+        """
+        for row in feedback_rows:
+            if isinstance(row, dict):
+                row = Feedback(
+                    decision_id=row.get('decision_id', ''),
+                    timestamp=datetime.now(),
+                    outcome=row.get('outcome', ''),
+                    metrics=row.get('metrics', {}),
+                    actual_result=row.get('actual_result', {}),
+                    feedback_score=row.get('performance_score', 0.0)
+                )
+            self.feedback_history.append(row)
+            self._update_performance_metrics(row)
+
+        logger.info(f"Recorded batch of {len(feedback_rows)} feedback entries")
+
     def _update_performance_metrics(self, feedback: Feedback) -> None:
         """Update performance metrics based on feedback"""
         if 'accuracy' in feedback.metrics:
@@ -195,8 +231,15 @@ class FeedbackLoop:
             'performance_metrics': self.performance_metrics
         }
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
         
         logger.info(f"Exported feedback loop data to {filename}")
 
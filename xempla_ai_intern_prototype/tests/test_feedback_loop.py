@@ -22,6 +22,7 @@ from unittest.mock import patch, MagicMock
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.feedback import FeedbackCollector, FeedbackStore, FeedbackAnalyzer
+from src.feedback.feedback_loop import FeedbackLoop, Feedback
 
 class TestFeedbackLoop(unittest.TestCase):
     """Test suite for closed-loop feedback system."""
@@ -238,6 +239,47 @@ class TestFeedbackLoop(unittest.TestCase):
             except Exception as e:
                 self.fail(f"FeedbackStore should handle invalid paths gracefully: {e}")
 
+    def test_record_feedback_batch(self):
+        """Test batch feedback recording for both accepted row shapes."""
+        loop = FeedbackLoop()
+        rows = [
+            Feedback(
+                decision_id="d1",
+                timestamp=datetime.now(),
+                outcome="success",
+                metrics={"accuracy": 0.9, "efficiency": 0.8},
+                actual_result={"result": "success"},
+                feedback_score=0.9
+            ),
+            {
+                "decision_id": "d2",
+                "outcome": "failure",
+                "metrics": {"accuracy": 0.4},
+                "performance_score": 0.4
+            },
+            {}  # raw dict relying entirely on the defaulted fields
+        ]
+        loop.record_feedback_batch(rows)
+
+        self.assertEqual(len(loop.feedback_history), 3)
+        self.assertEqual(loop.feedback_history[0].outcome, "success")
+
+        # Dict rows are normalized into Feedback objects
+        normalized = loop.feedback_history[1]
+        self.assertIsInstance(normalized, Feedback)
+        self.assertEqual(normalized.decision_id, "d2")
+        self.assertEqual(normalized.outcome, "failure")
+        self.assertEqual(normalized.feedback_score, 0.4)
+
+        defaulted = loop.feedback_history[2]
+        self.assertEqual(defaulted.decision_id, "")
+        self.assertEqual(defaulted.metrics, {})
+        self.assertEqual(defaulted.feedback_score, 0.0)
+
+        # Metrics flow into the running performance series
+        self.assertEqual(loop.performance_metrics["accuracy"], [0.9, 0.4])
+        self.assertEqual(loop.performance_metrics["efficiency"], [0.8])
+
     def test_feedback_export_and_import(self):
         """Test feedback data export and import functionality."""
         # TODO: Test data export formats (JSON, CSV, etc.)